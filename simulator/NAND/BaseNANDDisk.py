@@ -7,12 +7,19 @@ This is the base class to handle a single NAND cell in a very naive and basic im
 """
 
 # IMPORTS
-from decimal import Decimal, getcontext
+from operator import truediv
+import numpy as np
 from simulator.NAND.NANDInterface import NANDInterface
-from simulator.NAND.common import PAGE_EMPTY, PAGE_IN_USE, PAGE_DIRTY, DECIMAL_PRECISION, bytes_to_mib, pages_to_mib, \
+from simulator.NAND.common import PAGE_EMPTY, bytes_to_mib, pages_to_mib, \
     OPERATION_SUCCESS, OPERATION_FAILED_DIRTY, OPERATION_FAILED_DISKFULL
-from simulator.NAND.common import get_quantized_decimal as qd, check_block, check_page
+from simulator.NAND.common import STATS_SIZE, STAT_ELAPSED_TIME, STAT_HOST_PAGE_WRITE_REQUEST, \
+    STAT_PAGE_WRITE_EXECUTED, STAT_PAGE_WRITE_FAILED, STAT_PAGE_READ_EXECUTED, STAT_BLOCK_ERASE_EXECUTED, \
+    STAT_HOST_PAGE_READ_REQUEST, STAT_GC_FORCED_COUNT, STAT_EMPTY_PAGES, STAT_DIRTY_PAGES
+from simulator.NAND._kernels import WRITE_SUCCESS, WRITE_BLOCK_FULL, first_empty_page, raw_write, raw_read, \
+    raw_erase, host_write_batch
+from simulator.NAND.common import get_quantized_decimal as qd
 from simulator.NAND.common import get_integer_decimal as qz
+from simulator.NAND.common import get_decimal_ratio as dr, DECIMAL_CONTEXT
 
 
 # BaseNANDDISK class
@@ -20,6 +27,11 @@ class BaseNANDDisk(NANDInterface):
     """
     This class ...
     """
+    # every attribute has a slot: no per-instance __dict__ (see NANDFactory.get_class)
+    __slots__ = ('total_blocks', 'pages_per_block', 'page_size', 'total_pages', 'block_size', 'total_disk_size',
+                 'write_page_time', 'read_page_time', 'erase_block_time',
+                 '_TB', '_PPB', '_WPT', '_RPT', '_EBT',
+                 '_stats', '_status', '_empty', '_dirty', '_next_free')
 
     # CONSTRUCTOR
     def __init__(self, total_blocks=256, pages_per_block=128, page_size=4096,
@@ -79,71 +91,103 @@ class BaseNANDDisk(NANDInterface):
             This is an integer value. Must be greater than zero.
         """
 
-        # INTERNAL STATISTICS
-        self._elapsed_time = 0
-        """ Keep track of the total elapsed time for the requested operations [microseconds].
-            A microsecond is 10^-6 seconds. This variable is an integer.
+        # CACHED CHARACTERISTICS
+        # Plain integer copies of the physical characteristics, used by the disk operations.
+        # The physical characteristics must not be changed after the construction.
+        self._TB = int(self.total_blocks)
+        """ The total physical number of block available (see total_blocks).
+        """
+
+        self._PPB = int(self.pages_per_block)
+        """ The number of pages per single block (see pages_per_block).
         """
 
-        self._host_page_write_request = 0
-        """ Number of page written as requested by the host.
-            This is an integer value.
+        self._WPT = int(self.write_page_time)
+        """ The time to write a single page in [microseconds] (see write_page_time).
         """
 
-        self._page_write_executed = 0
-        """ Total number of page actually written by the disk.
-            This is an integer value.
+        self._RPT = int(self.read_page_time)
+        """ The time to read a single page in [microseconds] (see read_page_time).
         """
 
-        self._page_write_failed = 0
-        """ Total number of page unable to be writted due to disk error (no empty pages).
-            This is an integer value.
+        self._EBT = int(self.erase_block_time)
+        """ The time to erase a single block in [microseconds] (see erase_block_time).
         """
 
-        self._host_page_read_request = 0
-        """ Number of page read as requested by the host.
-            This is an integer value.
+        # INTERNAL STATISTICS
+        self._stats = np.zeros(STATS_SIZE, dtype=np.int64)
+        """ All the counters of the disk, packed in a single vector of int64 so the compiled kernels
+            can update them (see simulator.NAND._kernels). Every item is indexed by a STAT_* constant:
+                STAT_ELAPSED_TIME:              total elapsed time for the requested operations [microseconds];
+                STAT_HOST_PAGE_WRITE_REQUEST:   number of page written as requested by the host;
+                STAT_PAGE_WRITE_EXECUTED:       total number of page actually written by the disk;
+                STAT_PAGE_WRITE_FAILED:         total number of page unable to be written due to disk error
+                                                (no empty pages);
+                STAT_PAGE_READ_EXECUTED:        total number of page actually read by the disk;
+                STAT_BLOCK_ERASE_EXECUTED:      total number of block erase executed;
+                STAT_HOST_PAGE_READ_REQUEST:    number of page read as requested by the host;
+                STAT_GC_FORCED_COUNT:           total number of times the gc was forced to clean dirty pages;
+                STAT_EMPTY_PAGES:               running total of the empty pages of the disk (see _empty);
+                STAT_DIRTY_PAGES:               running total of the dirty pages of the disk (see _dirty).
+        """
+        self._stats[STAT_EMPTY_PAGES] = self.total_pages  # all pages are empty at the beginning
+
+        # INTERNAL STATE
+        # This is the full state of the flash memory (the FTL), kept as a Structure of Arrays.
+        self._status = np.full((self._TB, self._PPB), PAGE_EMPTY, dtype=np.uint8)
+        """ The status of every page: it's a (total_blocks x pages_per_block) matrix of uint8.
+            Every item is one of PAGE_EMPTY, PAGE_IN_USE or PAGE_DIRTY. All pages are empty at the beginning.
         """
 
-        self._page_read_executed = 0
-        """ Total number of page actually read by the disk.
-            This is an integer value.
+        self._empty = np.full(self._TB, self._PPB, dtype=np.int32)
+        """ Total number of empty pages in every block: it's a vector of int32 of length total_blocks.
+            All pages are empty at the beginning.
         """
 
-        self._block_erase_executed = 0
-        """ Total number of block erase executed.
-            This is an integer value.
+        self._dirty = np.zeros(self._TB, dtype=np.int32)
+        """ Total number of dirty pages in every block: it's a vector of int32 of length total_blocks.
+            No dirty pages at the beginning.
         """
 
-        self._gc_forced_count = 0
-        """ Total number of times the gc was forced to clean dirty pages.
-            This is an integer value.
+        self._next_free = np.zeros(self._TB, dtype=np.int32)
+        """ The index of the first page that may be empty in every block: it's a vector of int32 of length
+            total_blocks. No page before this index is empty, so the search for an empty page starts from here.
+            It's reset to zero every time the block is erased.
         """
 
-        # INTERNAL STATE
-        self._ftl = dict()
-        """ This is the full state of the flash memory.
-            It's an array of blocks. Every block is an array of page.
-            For every page we keep the status of the page.
-            Furthermore, every block has the following extra information:
-                empty:  total number of empty pages in the given block;
-                dirty:  total number of dirty pages in the given block.
-        """
-
-        # set the decimal context
-        getcontext().prec = DECIMAL_PRECISION
-
-        # initialize the FTL
-        for b in range(0, self.total_blocks):
-            # for every block initialize the page structure
-            self._ftl[b] = dict()
-            for p in range(0, self.pages_per_block):
-                # for every page set the empty status
-                self._ftl[b][p] = PAGE_EMPTY
-
-            # for every block initialize the internal data
-            self._ftl[b]['empty'] = self.pages_per_block  # all pages are empty
-            self._ftl[b]['dirty'] = 0  # no dirty pages at the beginning
+    # COUNTERS
+    # Read-only integer views of the statistics vector, with the names of the former counter attributes.
+    @property
+    def _elapsed_time(self):
+        return int(self._stats[STAT_ELAPSED_TIME])
+
+    @property
+    def _host_page_write_request(self):
+        return int(self._stats[STAT_HOST_PAGE_WRITE_REQUEST])
+
+    @property
+    def _page_write_executed(self):
+        return int(self._stats[STAT_PAGE_WRITE_EXECUTED])
+
+    @property
+    def _page_write_failed(self):
+        return int(self._stats[STAT_PAGE_WRITE_FAILED])
+
+    @property
+    def _host_page_read_request(self):
+        return int(self._stats[STAT_HOST_PAGE_READ_REQUEST])
+
+    @property
+    def _page_read_executed(self):
+        return int(self._stats[STAT_PAGE_READ_EXECUTED])
+
+    @property
+    def _block_erase_executed(self):
+        return int(self._stats[STAT_BLOCK_ERASE_EXECUTED])
+
+    @property
+    def _gc_forced_count(self):
+        return int(self._stats[STAT_GC_FORCED_COUNT])
 
     # METHODS
     # PYTHON UTILITIES
@@ -168,61 +212,56 @@ class BaseNANDDisk(NANDInterface):
                "".format(self.get_write_policy_name(), self.get_gc_name(),
                          self.pages_per_block, self.total_blocks, self.total_pages, self.page_size,
                          qd(bytes_to_mib(self.total_disk_size)),
-                         qd(bytes_to_mib(Decimal(10 ** 6 / self.read_page_time)) * self.page_size),
-                         qd(bytes_to_mib(Decimal(10 ** 6 / self.write_page_time)) * self.page_size),
+                         qd(DECIMAL_CONTEXT.multiply(dr(10 ** 6 / self.read_page_time, 1048576), self.page_size)),
+                         qd(DECIMAL_CONTEXT.multiply(dr(10 ** 6 / self.write_page_time, 1048576), self.page_size)),
                          self.number_of_dirty_pages(),
                          qd(pages_to_mib(self.number_of_dirty_pages(), self.page_size)),
                          self.number_of_empty_pages(),
                          qd(pages_to_mib(self.number_of_empty_pages(), self.page_size)),
                          self.number_of_in_use_pages(),
                          qd(pages_to_mib(self.number_of_in_use_pages(), self.page_size)),
-                         self._host_page_read_request,
-                         qd(pages_to_mib(self._host_page_read_request, self.page_size)),
-                         self._host_page_write_request,
-                         qd(pages_to_mib(self._host_page_write_request, self.page_size)),
-                         self._page_read_executed,
-                         qd(pages_to_mib(self._page_read_executed, self.page_size)),
-                         self._page_write_executed,
-                         qd(pages_to_mib(self._page_write_executed, self.page_size)),
-                         self._block_erase_executed,
-                         qd(bytes_to_mib(self._block_erase_executed * self.block_size)),
-                         qd(self.failure_rate()), self._page_write_failed,
-                         qd(pages_to_mib(self._page_write_failed, self.page_size)),
-                         self._gc_forced_count,
-                         qd(self.elapsed_time_seconds()), qz(self.IOPS()), qd(self.bandwidth_host()),
-                         qd(self.write_amplification()))
+                         self._stats[STAT_HOST_PAGE_READ_REQUEST],
+                         qd(pages_to_mib(self._stats[STAT_HOST_PAGE_READ_REQUEST], self.page_size)),
+                         self._stats[STAT_HOST_PAGE_WRITE_REQUEST],
+                         qd(pages_to_mib(self._stats[STAT_HOST_PAGE_WRITE_REQUEST], self.page_size)),
+                         self._stats[STAT_PAGE_READ_EXECUTED],
+                         qd(pages_to_mib(self._stats[STAT_PAGE_READ_EXECUTED], self.page_size)),
+                         self._stats[STAT_PAGE_WRITE_EXECUTED],
+                         qd(pages_to_mib(self._stats[STAT_PAGE_WRITE_EXECUTED], self.page_size)),
+                         self._stats[STAT_BLOCK_ERASE_EXECUTED],
+                         qd(bytes_to_mib(self._stats[STAT_BLOCK_ERASE_EXECUTED] * self.block_size)),
+                         qd(self.failure_rate(dr)), self._stats[STAT_PAGE_WRITE_FAILED],
+                         qd(pages_to_mib(self._stats[STAT_PAGE_WRITE_FAILED], self.page_size)),
+                         self._stats[STAT_GC_FORCED_COUNT],
+                         qd(self.elapsed_time_seconds(dr)), qz(self.IOPS(dr)), qd(self.bandwidth_host(dr)),
+                         qd(self.write_amplification(dr)))
 
     # STATISTICAL UTILITIES
-    def write_amplification(self):
+    def write_amplification(self, divide=truediv):
         """
 
+        :param divide: the division to use, the float one by default (ie: get_decimal_ratio for the reports).
         :return:
         """
         # avoid divide by zero errors
-        if self._host_page_write_request <= 0:
-            return Decimal('0')
+        if self._stats[STAT_HOST_PAGE_WRITE_REQUEST] <= 0:
+            return divide(0, 1)
 
-        return Decimal(self._page_write_executed) / Decimal(self._host_page_write_request)
+        return divide(int(self._stats[STAT_PAGE_WRITE_EXECUTED]), int(self._stats[STAT_HOST_PAGE_WRITE_REQUEST]))
 
     def number_of_empty_pages(self):
         """
 
         :return:
         """
-        tot = 0
-        for b in range(0, self.total_blocks):
-            tot += self._ftl[b]['empty']
-        return tot
+        return int(self._stats[STAT_EMPTY_PAGES])
 
     def number_of_dirty_pages(self):
         """
 
         :return:
         """
-        tot = 0
-        for b in range(0, self.total_blocks):
-            tot += self._ftl[b]['dirty']
-        return tot
+        return int(self._stats[STAT_DIRTY_PAGES])
 
     def number_of_in_use_pages(self):
         """
@@ -231,65 +270,73 @@ class BaseNANDDisk(NANDInterface):
         """
         return self.total_pages - (self.number_of_empty_pages() + self.number_of_dirty_pages())
 
-    def failure_rate(self):
+    def failure_rate(self, divide=truediv):
         """
 
+        :param divide: the division to use, the float one by default (ie: get_decimal_ratio for the reports).
         :return:
         """
         # avoid divide by zero errors
-        if self._page_write_executed <= 0:
-            return Decimal('0')
+        if self._stats[STAT_PAGE_WRITE_EXECUTED] <= 0:
+            return divide(0, 1)
 
-        return Decimal(self._page_write_failed * 100) / Decimal(self._page_write_executed)
+        return divide(int(self._stats[STAT_PAGE_WRITE_FAILED]) * 100, int(self._stats[STAT_PAGE_WRITE_EXECUTED]))
 
     def elapsed_time(self):
         """
 
         :return:
         """
-        return self._elapsed_time
+        return int(self._stats[STAT_ELAPSED_TIME])
 
-    def elapsed_time_seconds(self):
+    def elapsed_time_seconds(self, divide=truediv):
         """
 
+        :param divide: the division to use, the float one by default (ie: get_decimal_ratio for the reports).
         :return:
         """
-        return Decimal(self._elapsed_time) / Decimal(10 ** 6)
+        return divide(int(self._stats[STAT_ELAPSED_TIME]), 10 ** 6)
 
-    def IOPS(self):
+    def IOPS(self, divide=truediv):
         """
 
+        :param divide: the division to use, the float one by default (ie: get_decimal_ratio for the reports).
         :return:
         """
         # avoid divide by zero errors
-        if self._elapsed_time <= 0:
-            return Decimal('0')
+        if self._stats[STAT_ELAPSED_TIME] <= 0:
+            return divide(0, 1)
 
-        ops = self._page_write_executed + self._page_read_executed
-        return Decimal(ops) / self.elapsed_time_seconds()
+        # scale the operations (not the time) to get a single rounding
+        ops = int(self._stats[STAT_PAGE_WRITE_EXECUTED] + self._stats[STAT_PAGE_READ_EXECUTED])
+        return divide(ops * 10 ** 6, int(self._stats[STAT_ELAPSED_TIME]))
 
-    def bandwidth_host(self):
+    def bandwidth_host(self, divide=truediv):
         """
 
+        :param divide: the division to use, the float one by default (ie: get_decimal_ratio for the reports).
         :return:
         """
         # avoid divide by zero errors
-        if self._elapsed_time <= 0:
-            return Decimal('0')
+        if self._stats[STAT_ELAPSED_TIME] <= 0:
+            return divide(0, 1)
 
-        # in MiB
-        return pages_to_mib((self._host_page_write_request + self._host_page_read_request),
-                            self.page_size) / Decimal(self.elapsed_time_seconds())
+        # in MiB (the time is not scaled, see IOPS)
+        pages = int(self._stats[STAT_HOST_PAGE_WRITE_REQUEST] + self._stats[STAT_HOST_PAGE_READ_REQUEST])
+        mib = divide(pages * self.page_size, 1048576)
+        return divide(mib * 10 ** 6, int(self._stats[STAT_ELAPSED_TIME]))
 
     def get_stats(self):
         """
 
         :return:
         """
-        return self._elapsed_time, qz(self.IOPS()), qd(self.bandwidth_host()), \
-            qd(self.write_amplification()), self._host_page_write_request, self._host_page_read_request, \
-            self._page_write_executed, self._page_read_executed, self._block_erase_executed,\
-            self._page_write_failed, self.number_of_dirty_pages()
+        stats = self._stats
+        return int(stats[STAT_ELAPSED_TIME]), qz(self.IOPS(dr)), qd(self.bandwidth_host(dr)), \
+            qd(self.write_amplification(dr)), int(stats[STAT_HOST_PAGE_WRITE_REQUEST]), \
+            int(stats[STAT_HOST_PAGE_READ_REQUEST]), int(stats[STAT_PAGE_WRITE_EXECUTED]), \
+            int(stats[STAT_PAGE_READ_EXECUTED]), \
+            int(stats[STAT_BLOCK_ERASE_EXECUTED]), int(stats[STAT_PAGE_WRITE_FAILED]), self.number_of_dirty_pages()
 
     # DISK OPERATIONS UTILITIES
     def is_write_failing(self):
@@ -297,26 +344,24 @@ class BaseNANDDisk(NANDInterface):
 
         :return:
         """
-        return self._page_write_failed > 0
+        return self._stats[STAT_PAGE_WRITE_FAILED] > 0
 
-    @check_block
     def get_empty_page(self, block=0):
         """
 
         :param block:
         :return:
         """
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+
         # first check availability
-        if self._ftl[block]['empty'] <= 0:
+        if self._empty[block] <= 0:
             raise ValueError("No empty pages available in this block.")
 
         # get the first empty page available in the provided block
-        for p in range(0, self.pages_per_block):
-            if self._ftl[block][p] == PAGE_EMPTY:
-                return p
-
-        # should not be reachable
-        raise ValueError("No empty pages available in this block.")
+        return first_empty_page(self._status, self._next_free, block)
 
     def get_empty_block(self):
         """
@@ -324,16 +369,14 @@ class BaseNANDDisk(NANDInterface):
         :return:
         """
         # get the first empty block available
-        for b in range(0, self.total_blocks):
-            if self._ftl[b]['empty'] == self.pages_per_block:
-                return True, b
+        blocks = np.flatnonzero(self._empty == self._PPB)
+        if blocks.size > 0:
+            return True, int(blocks[0])
 
-        # should not be reachable
+        # no empty block available
         return False, 0
 
     # RAW DISK OPERATIONS
-    @check_block
-    @check_page
     def raw_write_page(self, block=0, page=0):
         """
 
@@ -341,59 +384,33 @@ class BaseNANDDisk(NANDInterface):
         :param page:
         :return: True if the write is successful, false otherwise (the write is discarded)
         """
-        # read the FTL to check the current status
-        s = self._ftl[block][page]
-
-        # if status is EMPTY => WRITE OK
-        if s == PAGE_EMPTY:
-            # change the status of this page
-            self._ftl[block][page] = PAGE_IN_USE
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+        if page < 0 or page >= self._PPB:
+            raise ValueError("page parameter out of range.")
 
-            # we need to update the statistics
-            self._ftl[block]['empty'] -= 1  # we lost one empty page in this block
-            self._elapsed_time += self.write_page_time  # time spent to write the data
-            self._page_write_executed += 1  # one page written
+        # execute the write on the FTL
+        res = raw_write(self._status, self._empty, self._dirty, self._next_free, self._stats, block, page,
+                        self._WPT)
+        if res == WRITE_SUCCESS:
             return True, OPERATION_SUCCESS
 
-        # if status is IN USE => we consider a data change,
-        # we use the current disk policy to find a new page to write the new data. In case of success we invalidate
-        # the current page, otherwise the operation fails.
-        if s == PAGE_IN_USE:
-            # is the block full?
-            if self._ftl[block]['empty'] <= 0:
-                # yes, we need a policy to decide how to write
-                if self.full_block_write_policy(block=block, page=page):
-                    # all statistic MUST BE updated inside the policy method
-                    return True, OPERATION_SUCCESS
-                else:
-                    # we didn't found a suitable place to write the new data, the write request failed
-                    # this is a disk error: the garbage collector was unable to make room for new data
-                    self._page_write_failed += 1
-                    return False, OPERATION_FAILED_DISKFULL
-            else:
-                # no, we still have space, we just need a new empty page on this block
-                # find and write the new page
-                newpage = self.get_empty_page(block=block)
-
-                # change the status of this page
-                self._ftl[block][page] = PAGE_DIRTY
-
-                # change the status of the new page
-                self._ftl[block][newpage] = PAGE_IN_USE
-
-                # we need to update the statistics
-                self._ftl[block]['empty'] -= 1  # we lost one empty page in this block
-                self._ftl[block]['dirty'] += 1  # we have one more dirty page in this block
-                self._elapsed_time += self.write_page_time  # time spent to write the data
-                self._page_write_executed += 1  # one page written
+        # if the page was IN USE and the block is full we need a policy to decide how to write
+        if res == WRITE_BLOCK_FULL:
+            if self.full_block_write_policy(block, page):
+                # all statistic MUST BE updated inside the policy method
                 return True, OPERATION_SUCCESS
+            else:
+                # we didn't found a suitable place to write the new data, the write request failed
+                # this is a disk error: the garbage collector was unable to make room for new data
+                self._stats[STAT_PAGE_WRITE_FAILED] += 1
+                return False, OPERATION_FAILED_DISKFULL
 
         # if status is DIRTY => we discard this write operation
         # (it's not a disk error, it's a bad random value)
         return False, OPERATION_FAILED_DIRTY
 
-    @check_block
-    @check_page
     def raw_read_page(self, block=0, page=0):
         """
 
@@ -401,42 +418,34 @@ class BaseNANDDisk(NANDInterface):
         :param page:
         :return:
         """
-        # read the FTL to check the current status
-        s = self._ftl[block][page]
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+        if page < 0 or page >= self._PPB:
+            raise ValueError("page parameter out of range.")
 
-        if s == PAGE_IN_USE:
-            # update statistics
-            self._elapsed_time += self.read_page_time  # time spent to read the data
-            self._page_read_executed += 1  # we executed a read of a page
+        # execute the read on the FTL
+        if raw_read(self._status, self._stats, block, page, self._RPT):
             return True, OPERATION_SUCCESS
 
         # no valid data to read
         return False, OPERATION_FAILED_DIRTY  # always fail to dirty read (empty or dirty page)
 
-    @check_block
     def raw_erase_block(self, block=0):
         """
 
         :param block:
         :return:
         """
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+
         # should mark the full block as dirty and then erase it
         # as we are in a simulation, we directly erase it
-        for p in range(0, self.pages_per_block):
-            # for every page set the empty status
-            self._ftl[block][p] = PAGE_EMPTY
-
-        # for every block initialize the internal data
-        self._ftl[block]['empty'] = self.pages_per_block  # all pages are empty
-        self._ftl[block]['dirty'] = 0  # fresh as new
-
-        # update the statistics
-        self._block_erase_executed += 1  # new erase operation
-        self._elapsed_time += self.erase_block_time  # time spent to erase a block
+        raw_erase(self._status, self._empty, self._dirty, self._next_free, self._stats, block, self._EBT)
         return True
 
-    @check_block
-    @check_page
     def host_write_page(self, block=0, page=0, gc_was_forced=False):
         """
 
@@ -444,26 +453,81 @@ class BaseNANDDisk(NANDInterface):
         :param page:
         :return:
         """
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+        if page < 0 or page >= self._PPB:
+            raise ValueError("page parameter out of range.")
+
         # check if we need to run the garbage collector
         self.run_gc(force_run=gc_was_forced)
 
         # execute the write
-        res, status = self.raw_write_page(block=block, page=page)
+        res, status = self.raw_write_page(block, page)
         if res:
             # update statistics
-            self._host_page_write_request += 1  # the host actually asked to write a page
+            self._stats[STAT_HOST_PAGE_WRITE_REQUEST] += 1  # the host actually asked to write a page
         elif not gc_was_forced and status == OPERATION_FAILED_DISKFULL:
             # if we had a failure, we try it again
-            self._page_write_failed -= 1
+            self._stats[STAT_PAGE_WRITE_FAILED] -= 1
 
             # force a gc run and retry
-            self._gc_forced_count += 1
-            return self.host_write_page(block=block, page=page, gc_was_forced=True)
+            self._stats[STAT_GC_FORCED_COUNT] += 1
+            return self.host_write_page(block, page, gc_was_forced=True)
 
         return res, status
 
-    @check_block
-    @check_page
+    def host_write_pages(self, blocks, pages):
+        """
+        Execute a batch of host page writes, in order, with the same result of calling host_write_page on every
+        block and page. The writes run in a compiled kernel, only the ones that need the garbage collector (or a
+        write policy available in Python only) go through host_write_page.
+
+        :param blocks: the block indexes of the writes (array of integers).
+        :param pages: the page indexes of the writes (array of integers, same length of blocks).
+        :return: the number of pages actually written.
+        """
+        blocks = np.asarray(blocks)
+        pages = np.asarray(pages)
+
+        # check the parameters, even with python -O: the kernel does not check the indexes
+        if blocks.ndim != 1 or pages.ndim != 1:
+            raise ValueError("blocks and pages must be one dimensional arrays.")
+        if blocks.shape != pages.shape:
+            raise ValueError("blocks and pages must have the same length.")
+
+        # an index is never cast (it could be truncated or wrapped around)
+        if blocks.size > 0 and blocks.dtype.kind not in 'iu':
+            raise TypeError("blocks must be an array of integers.")
+        if pages.size > 0 and pages.dtype.kind not in 'iu':
+            raise TypeError("pages must be an array of integers.")
+        if blocks.size > 0 and (blocks.min() < 0 or blocks.max() >= self._TB):
+            raise ValueError("block parameter out of range.")
+        if pages.size > 0 and (pages.min() < 0 or pages.max() >= self._PPB):
+            raise ValueError("page parameter out of range.")
+
+        # the indexes are in range: this conversion is exact
+        blocks = np.ascontiguousarray(blocks, dtype=np.int64)
+        pages = np.ascontiguousarray(pages, dtype=np.int64)
+
+        stats = self._stats
+        policy = self.get_full_block_write_kernel()
+        written = stats[STAT_HOST_PAGE_WRITE_REQUEST]
+        i = 0
+        while i < blocks.size:
+            i = host_write_batch(self._status, self._empty, self._dirty, self._next_free, stats, blocks, pages, i,
+                                 self.gc_next_run_time(), policy, self._WPT, self._RPT, self._EBT)
+
+            # this write needs the garbage collector or the write policy: leave it to host_write_page, and the
+            # following ones too as long as the garbage collector may run (the kernel would stop on every one of them)
+            while i < blocks.size:
+                self.host_write_page(int(blocks[i]), int(pages[i]))
+                i += 1
+                if not 0 <= self.gc_next_run_time() <= stats[STAT_ELAPSED_TIME]:
+                    break
+
+        return int(stats[STAT_HOST_PAGE_WRITE_REQUEST] - written)
+
     def host_read_page(self, block=0, page=0):
         """
 
@@ -471,13 +535,19 @@ class BaseNANDDisk(NANDInterface):
         :param page:
         :return:
         """
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+        if page < 0 or page >= self._PPB:
+            raise ValueError("page parameter out of range.")
+
         # check if we need to run the garbage collector
         self.run_gc()
 
         # execute the write
-        res, status = self.raw_read_page(block=block, page=page)
+        res, status = self.raw_read_page(block, page)
         if res:
             # update statistics
-            self._host_page_read_request += 1  # the host actually asked to read a page
+            self._stats[STAT_HOST_PAGE_READ_REQUEST] += 1  # the host actually asked to read a page
 
         return res, status
@@ -15,6 +15,8 @@ class GarbageCollectorInterface(NANDInterface, metaclass=ABCMeta):
     """
     To be written ...
     """
+    __slots__ = ()
+
     # METHODS
     @abstractclassmethod
     def check_gc_run(self, force_run=False):
@@ -32,6 +34,21 @@ class GarbageCollectorInterface(NANDInterface, metaclass=ABCMeta):
     def get_gc_name(self):
         return NotImplemented
 
+    @abstractclassmethod
+    def gc_next_run_time(self):
+        return NotImplemented
+
+    def select_gc_blocks(self, force_run=False):
+        """
+        The blocks to clean, in order. By default every block is checked just before it's cleaned (see check_gc_block):
+        a garbage collector whose checks don't depend on the blocks already cleaned can select them all at once.
+
+        :param force_run: True if the gc run was forced.
+        :return: an iterable of valid block indexes.
+        """
+        check_gc_block = self.check_gc_block
+        return (b for b in range(0, self._TB) if check_gc_block(b, force_run))
+
     def run_gc(self, force_run=False):
         """
 
@@ -39,16 +56,15 @@ class GarbageCollectorInterface(NANDInterface, metaclass=ABCMeta):
         """
         # check the overall conditions to execute the gc
         if self.check_gc_run(force_run=force_run):
-            # run the gc on every block
+            # run the gc on every selected block (the indexes are valid by construction, so they are not checked)
             execution = False
-            for b in range(0, self.total_blocks):
-                # check the conditions on this block
-                if self.check_gc_block(block=b, force_run=force_run):
-                    # ok, run it
-                    res = self.execute_gc_block(block=b)
-                    if not execution and res:
-                        # ok, the gc was executed on at least one block
-                        execution = True
+            execute_gc_block = self.execute_gc_block
+            for b in self.select_gc_blocks(force_run):
+                # ok, run it
+                res = execute_gc_block(b)
+                if not execution and res:
+                    # ok, the gc was executed on at least one block
+                    execution = True
 
             return execution
 
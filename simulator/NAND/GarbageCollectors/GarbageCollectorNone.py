@@ -8,17 +8,26 @@ This is the empty garbage collector. Never executed.
 
 # IMPORTS
 from simulator.NAND.GarbageCollectors.GarbageCollectorInterface import GarbageCollectorInterface
-from simulator.NAND.common import check_block
 
 
 class GarbageCollectorNone(GarbageCollectorInterface):
     """
     To be written ...
     """
+    __slots__ = ()
+
     # METHODS
     def get_gc_name(self):
         return "none"
 
+    def gc_next_run_time(self):
+        """
+
+        :return: the simulation time from which the gc may run, -1 as it never runs (not even when forced).
+        """
+        # Always skip garbage collector
+        return -1
+
     def check_gc_run(self, force_run=False):
         """
 
@@ -27,7 +36,6 @@ class GarbageCollectorNone(GarbageCollectorInterface):
         # Always skip garbage collector
         return False
 
-    @check_block
     def check_gc_block(self, block=0, force_run=False):
         """
 
@@ -37,7 +45,6 @@ class GarbageCollectorNone(GarbageCollectorInterface):
         # Always skip garbage collector
         return False
 
-    @check_block
     def execute_gc_block(self, block=0):
         """
 
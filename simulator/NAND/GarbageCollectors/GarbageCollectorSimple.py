@@ -9,8 +9,10 @@ only if a certain amount of time is passed after the last gc execution.
 
 # IMPORTS
 from decimal import Decimal, getcontext
+import numpy as np
 from simulator.NAND.GarbageCollectors.GarbageCollectorInterface import GarbageCollectorInterface
-from simulator.NAND.common import check_block, DECIMAL_PRECISION, PAGE_IN_USE, PAGE_EMPTY
+from simulator.NAND.common import DECIMAL_PRECISION, PAGE_IN_USE, STAT_ELAPSED_TIME, \
+    STAT_PAGE_WRITE_EXECUTED, STAT_PAGE_READ_EXECUTED, STAT_EMPTY_PAGES
 
 
 class GarbageCollectorSimple(GarbageCollectorInterface):
@@ -46,17 +48,42 @@ class GarbageCollectorSimple(GarbageCollectorInterface):
     def get_gc_name(self):
         return "simple ({}, {})".format(self.gc_param_mintime, self.gc_param_dirtiness)
 
+    def gc_next_run_time(self):
+        """
+
+        :return: the simulation time from which the gc may run.
+        """
+        # see check_gc_run
+        return self._last_run + self.gc_param_mintime
+
     def check_gc_run(self, force_run=False):
         """
 
         :return:
         """
         # the gc is executed if it's elapsed enough time
-        if self._elapsed_time - self._last_run >= self.gc_param_mintime:
+        if self._stats[STAT_ELAPSED_TIME] - self._last_run >= self.gc_param_mintime:
             return True
         return False
 
-    @check_block
+    def gc_min_dirty_pages(self):
+        """
+        The dirtiness threshold as a number of pages: a block is cleaned if it has at least these dirty pages.
+        It's the smallest count whose percentage of dirty pages (the same Decimal division of the block check)
+        reaches gc_param_dirtiness, pages_per_block + 1 if no count does.
+
+        :return: the minimum number of dirty pages of a block to clean.
+        """
+        # the percentage grows with the dirty pages: binary search on [0, pages_per_block + 1]
+        low, high = 0, self._PPB + 1
+        while low < high:
+            mid = (low + high) // 2
+            if Decimal(mid) / Decimal(self._PPB) >= self.gc_param_dirtiness:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
     def check_gc_block(self, block=0, force_run=False):
         """
 
@@ -64,15 +91,28 @@ class GarbageCollectorSimple(GarbageCollectorInterface):
         :return:
         """
         # if the force is set, we need at least a dirty page in a block
-        if force_run and self._ftl[block]['dirty'] > 0:
+        if force_run and self._dirty[block] > 0:
             return True
 
         # check the percentage of dirty pages of this block
-        if Decimal(self._ftl[block]['dirty']) / Decimal(self.pages_per_block) >= self.gc_param_dirtiness:
+        if self._dirty[block] >= self.gc_min_dirty_pages():
             return True
         return False
 
-    @check_block
+    def select_gc_blocks(self, force_run=False):
+        """
+        The same checks of check_gc_block on every block at once: cleaning a block does not change the dirty pages
+        of the others.
+
+        :param force_run: True if the gc run was forced.
+        :return: the list of block indexes.
+        """
+        dirty = self._dirty
+        selected = dirty >= self.gc_min_dirty_pages()
+        if force_run:
+            selected |= dirty > 0
+        return np.flatnonzero(selected).tolist()
+
     def execute_gc_block(self, block=0):
         """
 
@@ -81,20 +121,21 @@ class GarbageCollectorSimple(GarbageCollectorInterface):
         """
         # STEP 1: temporary copy the block data
         #         this is a read and only useful data are read
-        temp_block = dict()
-        for p in range(0, self.pages_per_block):
-            res, status = self.raw_read_page(block=block, page=p)
-            if res:
-                temp_block[p] = PAGE_IN_USE  # the page is valid and in use
-            else:
-                temp_block[p] = PAGE_EMPTY  # reset the page, even if is dirty
+        row = self._status[block]
+        stats = self._stats
+        valid = row == PAGE_IN_USE
+        n_valid = int(np.count_nonzero(valid))
+        stats[STAT_ELAPSED_TIME] += n_valid * self._RPT  # time spent to read the data
+        stats[STAT_PAGE_READ_EXECUTED] += n_valid  # we executed a read of every valid page
 
         # STEP 2: erase
-        self.raw_erase_block(block=block)
-
-        # STEP 3: write the IN USE pages only
-        for p in range(0, self.pages_per_block):
-            if temp_block[p] == PAGE_IN_USE:
-                self.raw_write_page(block=block, page=p)
+        self.raw_erase_block(block)
+
+        # STEP 3: write the IN USE pages only (every page keeps its original position)
+        row[valid] = PAGE_IN_USE
+        self._empty[block] -= n_valid  # we lost these empty pages in this block
+        stats[STAT_EMPTY_PAGES] -= n_valid
+        stats[STAT_ELAPSED_TIME] += n_valid * self._WPT  # time spent to write the data
+        stats[STAT_PAGE_WRITE_EXECUTED] += n_valid  # pages written
 
         return True
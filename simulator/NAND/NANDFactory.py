@@ -55,7 +55,8 @@ def get_class(writepolicy=WRITEPOLICY_DEFAULT, garbagecollector=GARBAGECOLLECTOR
         raise ValueError("Invalid garbage collector")
 
     # ASSEMBLE THE CLASS
-    return type(classname, (BaseNANDDisk, wp, gc), {})
+    # no __dict__ is added here: only a garbage collector with parameters (ie: GarbageCollectorSimple) has one
+    return type(classname, (BaseNANDDisk, wp, gc), {'__slots__': ()})
 
 
 def get_instance(writepolicy=WRITEPOLICY_DEFAULT, garbagecollector=GARBAGECOLLECTOR_NONE,
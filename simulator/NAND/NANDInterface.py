@@ -8,15 +8,16 @@ It's helpful to resolve the references for the objects.
 """
 
 # IMPORTS
-from abc import ABCMeta, abstractclassmethod
+from abc import ABCMeta, abstractmethod, abstractclassmethod
 
 
 class NANDInterface(metaclass=ABCMeta):
     """
     to be done
     """
+    __slots__ = ()
 
-    @abstractclassmethod
+    @abstractmethod
     def __init__(self):
         # ATTRIBUTES
         self.total_blocks = None
@@ -28,15 +29,16 @@ class NANDInterface(metaclass=ABCMeta):
         self.write_page_time = None
         self.read_page_time = None
         self.erase_block_time = None
-        self._elapsed_time = None
-        self._host_page_write_request = None
-        self._page_write_executed = None
-        self._page_write_failed = None
-        self._host_page_read_request = None
-        self._page_read_executed = None
-        self._block_erase_executed = None
-        self._gc_forced_count = None
-        self._ftl = None
+        self._TB = None
+        self._PPB = None
+        self._WPT = None
+        self._RPT = None
+        self._EBT = None
+        self._stats = None
+        self._status = None
+        self._empty = None
+        self._dirty = None
+        self._next_free = None
 
     # STATISTICAL UTILITIES
     @abstractclassmethod
@@ -105,6 +107,10 @@ class NANDInterface(metaclass=ABCMeta):
     def host_write_page(self, block=0, page=0, gc_was_forced=False):
         return NotImplemented
 
+    @abstractclassmethod
+    def host_write_pages(self, blocks, pages):
+        return NotImplemented
+
     @abstractclassmethod
     def host_read_page(self, block=0, page=0):
         return NotImplemented
@@ -9,43 +9,34 @@ just find the first available page in a different block.
 
 # IMPORTS
 from simulator.NAND.WritePolicies.WritePolicyInterface import WritePolicyInterface
-from simulator.NAND.common import check_block, check_page, PAGE_DIRTY, PAGE_IN_USE
+from simulator.NAND._kernels import FULL_BLOCK_DEFAULT, default_write
 
 
 class WritePolicyDefault(WritePolicyInterface):
     """
     To be written ...
     """
+    __slots__ = ()
+
+    # ATTRIBUTES
+    full_block_write_kernel = FULL_BLOCK_DEFAULT
+
     # METHODS
     def get_write_policy_name(self):
         return "default"
 
-    @check_block
-    @check_page
     def full_block_write_policy(self, block=0, page=0):
         """
 
         :param block:
         :return:
         """
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+        if page < 0 or page >= self._PPB:
+            raise ValueError("page parameter out of range.")
+
         # naive policy: just find the first available page in a different block
-        for b in range(0, self.total_blocks):
-            if b != block and self._ftl[b]['empty'] > 0:
-                # FOUND a block with empty pages
-                p = self.get_empty_page(block=b)
-
-                # change the status of the original page
-                self._ftl[block][page] = PAGE_DIRTY
-
-                # change the status of the new page
-                self._ftl[b][p] = PAGE_IN_USE
-
-                # we need to update the statistics
-                self._ftl[block]['dirty'] += 1  # we have one more dirty page in this block
-                self._ftl[b]['empty'] -= 1  # we lost one empty page in this block
-                self._elapsed_time += self.write_page_time  # time spent to write the data
-                self._page_write_executed += 1  # one page written
-                return True
-
-        # no empty page found
-        return False
+        return default_write(self._status, self._empty, self._dirty, self._next_free, self._stats, block, page,
+                             self._WPT)
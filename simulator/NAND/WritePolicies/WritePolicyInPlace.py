@@ -9,48 +9,37 @@ the garbage collector is run in place: as soon a block is full the block is modi
 
 # IMPORTS
 from simulator.NAND.WritePolicies.WritePolicyInterface import WritePolicyInterface
-from simulator.NAND.common import check_block, check_page, PAGE_EMPTY, PAGE_DIRTY, PAGE_IN_USE
+from simulator.NAND._kernels import FULL_BLOCK_IN_PLACE, in_place_write
 
 
 class WritePolicyInPlace(WritePolicyInterface):
     """
     To be written ...
     """
+    __slots__ = ()
+
+    # ATTRIBUTES
+    full_block_write_kernel = FULL_BLOCK_IN_PLACE
+
     # METHODS
     def get_write_policy_name(self):
         return "in place"
 
-    @check_block
-    @check_page
     def full_block_write_policy(self, block=0, page=0):
         """
 
         :param block:
         :return:
         """
-        # change the status of the original page, so we don't need to read it
-        self._ftl[block][page] = PAGE_DIRTY
-
-        # STEP 1: temporary copy the block data (this also simulates the in-memory change)
-        #         this is a read and only useful data are read
-        temp_block = dict()
-        for p in range(0, self.pages_per_block):
-            res, status = self.raw_read_page(block=block, page=p)
-            if res:
-                temp_block[p] = PAGE_IN_USE  # the page is valid and in use
-            else:
-                temp_block[p] = PAGE_EMPTY  # reset the page, even if is dirty
-
-        # in-memory change
-        temp_block[page] = PAGE_IN_USE
-
-        # STEP 2: erase
-        self.raw_erase_block(block=block)
-
-        # STEP 3: write the IN USE pages only
-        for p in range(0, self.pages_per_block):
-            if temp_block[p] == PAGE_IN_USE:
-                self.raw_write_page(block=block, page=p)
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+        if page < 0 or page >= self._PPB:
+            raise ValueError("page parameter out of range.")
+
+        # read the valid pages, erase the block and write back the valid pages with the in-memory change
+        in_place_write(self._status, self._empty, self._dirty, self._next_free, self._stats, block, page,
+                       self._WPT, self._RPT, self._EBT)
 
         # cannot fail as the substitution is in place
         return True
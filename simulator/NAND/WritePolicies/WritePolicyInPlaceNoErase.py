@@ -11,55 +11,34 @@ in a new free block (if available, otherwise the base policy is used). The previ
 
 # IMPORTS
 from simulator.NAND.WritePolicies.WritePolicyDefault import WritePolicyDefault
-from simulator.NAND.common import check_block, check_page, PAGE_EMPTY, PAGE_DIRTY, PAGE_IN_USE
+from simulator.NAND._kernels import FULL_BLOCK_IN_PLACE_NO_ERASE, in_place_no_erase_write
 
 
 class WritePolicyInPlaceNoErase(WritePolicyDefault):
     """
     To be written ...
     """
+    __slots__ = ()
+
+    # ATTRIBUTES
+    full_block_write_kernel = FULL_BLOCK_IN_PLACE_NO_ERASE
+
     # METHODS
     def get_write_policy_name(self):
         return "in place with no erase"
 
-    @check_block
-    @check_page
     def full_block_write_policy(self, block=0, page=0):
         """
 
         :param block:
         :return:
         """
-        # first we need to be sure there is a free block to execute the copy
-        res, newblock = self.get_empty_block()
-
-        if res:
-            # change the status of the original page, so we don't need to read it
-            self._ftl[block][page] = PAGE_DIRTY
-
-            # STEP 1: temporary copy the block data (this also simulates the in-memory change)
-            #         this is a read and only useful data are read
-            #         also set the original in use pages as dirty
-            temp_block = dict()
-            for p in range(0, self.pages_per_block):
-                # READ and change the status of the original page
-                res, status = self.raw_read_page(block=block, page=p)
-                if res:
-                    temp_block[p] = PAGE_IN_USE  # the page is valid and in use
-                    self._ftl[block][p] = PAGE_DIRTY  # set the original page as dirty
-                    self._ftl[block]['dirty'] += 1  # new dirty page
-                else:
-                    temp_block[p] = PAGE_EMPTY  # reset the page, even if is dirty, for the copy
-
-            # in-memory change
-            temp_block[page] = PAGE_IN_USE
-
-            # STEP 2: write the IN USE pages only in the new block
-            for p in range(0, self.pages_per_block):
-                if temp_block[p] == PAGE_IN_USE:
-                    self.raw_write_page(block=newblock, page=p)
-
-            return True
-
-        # if not, try the base naive approach
-        return super().full_block_write_policy(block=block, page=page)
+        # check the parameters, even with python -O: the kernels do not check the indexes
+        if block < 0 or block >= self._TB:
+            raise ValueError("block parameter out of range.")
+        if page < 0 or page >= self._PPB:
+            raise ValueError("page parameter out of range.")
+
+        # copy the valid pages in the first empty block (if not available, the base naive approach is used)
+        return in_place_no_erase_write(self._status, self._empty, self._dirty, self._next_free, self._stats, block,
+                                       page, self._WPT, self._RPT)
@@ -9,12 +9,23 @@ This is the Abstract class interface for all Write Policy implementations.
 # IMPORTS
 from abc import ABCMeta, abstractclassmethod
 from simulator.NAND.NANDInterface import NANDInterface
+from simulator.NAND._kernels import FULL_BLOCK_PYTHON
 
 
 class WritePolicyInterface(NANDInterface, metaclass=ABCMeta):
     """
     To be written ...
     """
+    __slots__ = ()
+
+    # ATTRIBUTES
+    full_block_write_kernel = FULL_BLOCK_PYTHON
+    """ The compiled kernel equivalent of full_block_write_policy, one of the FULL_BLOCK_* policies of
+        simulator.NAND._kernels. Unless it's FULL_BLOCK_PYTHON, the batch operations can execute the policy without
+        leaving the compiled kernel. It's used only along with the full_block_write_policy of the same class (see
+        get_full_block_write_kernel).
+    """
+
     # METHODS
     @abstractclassmethod
     def get_write_policy_name(self):
@@ -23,3 +34,17 @@ class WritePolicyInterface(NANDInterface, metaclass=ABCMeta):
     @abstractclassmethod
     def full_block_write_policy(self, block=0, page=0):
         return NotImplemented
+
+    def get_full_block_write_kernel(self):
+        """
+        The compiled kernel of the write policy actually in use: full_block_write_kernel is trusted only if it's set by
+        the class that defines full_block_write_policy, so a class that overrides the policy and not the kernel
+        (or the other way round) falls back to FULL_BLOCK_PYTHON.
+
+        :return: one of the FULL_BLOCK_* policies of simulator.NAND._kernels.
+        """
+        for cls in type(self).__mro__:
+            if 'full_block_write_policy' in vars(cls):
+                return vars(cls).get('full_block_write_kernel', FULL_BLOCK_PYTHON)
+
+        return FULL_BLOCK_PYTHON
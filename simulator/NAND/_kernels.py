@@ -0,0 +1,364 @@
+# This file is part of the WAF-Simulator by Nicholas Fiorentini (2015)
+# and is released under Creative Common Attribution 4.0 International (CC BY 4.0)
+# see README.txt or LICENSE.txt for details
+
+"""
+The compiled (Numba) kernels of the raw disk operations.
+Every kernel works directly on the FTL arrays and on the statistics vector of a BaseNANDDisk, so the whole
+state transition of an operation runs in nopython mode.
+"""
+
+# IMPORTS
+from numba import njit
+from simulator.NAND.common import PAGE_EMPTY, PAGE_IN_USE, PAGE_DIRTY, STAT_ELAPSED_TIME, STAT_PAGE_WRITE_EXECUTED, \
+    STAT_PAGE_READ_EXECUTED, STAT_BLOCK_ERASE_EXECUTED, STAT_HOST_PAGE_WRITE_REQUEST, STAT_EMPTY_PAGES, \
+    STAT_DIRTY_PAGES, STAT_PAGE_WRITE_FAILED, STAT_GC_FORCED_COUNT
+
+# KERNEL RESULTS
+# The results of a raw write
+WRITE_SUCCESS = 0
+WRITE_FAILED_DIRTY = 1
+WRITE_BLOCK_FULL = 2  # the page must be rewritten but the block is full: the write policy must be used
+
+# FULL BLOCK WRITE POLICIES
+# The write policies the kernels can execute when a block is full (see WritePolicyInterface.full_block_write_kernel)
+FULL_BLOCK_PYTHON = 0  # the policy is available in Python only
+FULL_BLOCK_DEFAULT = 1
+FULL_BLOCK_IN_PLACE = 2
+FULL_BLOCK_IN_PLACE_NO_ERASE = 3
+
+
+# KERNELS
+@njit(cache=True)
+def first_empty_page(status, next_free, block):
+    """
+    Find the first empty page of a block.
+    The scan starts from next_free[block], as no page before that index is empty: a page becomes empty again
+    only when its block is erased (and the erase resets the index).
+
+    :param status: the page status matrix of the disk.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param block: the block index.
+    :return: the index of the first empty page, -1 if the block has no empty pages.
+    """
+    row = status[block]
+    for p in range(next_free[block], row.shape[0]):
+        if row[p] == PAGE_EMPTY:
+            next_free[block] = p
+            return p
+
+    next_free[block] = row.shape[0]
+    return -1
+
+
+@njit(cache=True)
+def raw_write(status, empty, dirty, next_free, stats, block, page, write_page_time):
+    """
+    Write a single page. A page in use is rewritten on the first empty page of the same block.
+
+    :param status: the page status matrix of the disk.
+    :param empty: the number of empty pages per block.
+    :param dirty: the number of dirty pages per block.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param stats: the statistics vector of the disk.
+    :param block: the block index.
+    :param page: the page index.
+    :param write_page_time: the time to write a single page [microseconds].
+    :return: one of WRITE_SUCCESS, WRITE_FAILED_DIRTY or WRITE_BLOCK_FULL.
+    """
+    s = status[block, page]
+
+    # if status is EMPTY => WRITE OK
+    if s == PAGE_EMPTY:
+        status[block, page] = PAGE_IN_USE
+        empty[block] -= 1  # we lost one empty page in this block
+        stats[STAT_EMPTY_PAGES] -= 1
+        stats[STAT_ELAPSED_TIME] += write_page_time  # time spent to write the data
+        stats[STAT_PAGE_WRITE_EXECUTED] += 1  # one page written
+        return WRITE_SUCCESS
+
+    # if status is IN USE => we consider a data change and we write the new data in a new page of this block
+    if s == PAGE_IN_USE:
+        # is the block full? the write policy must decide
+        if empty[block] <= 0:
+            return WRITE_BLOCK_FULL
+
+        newpage = first_empty_page(status, next_free, block)
+        status[block, page] = PAGE_DIRTY
+        status[block, newpage] = PAGE_IN_USE
+        empty[block] -= 1  # we lost one empty page in this block
+        dirty[block] += 1  # we have one more dirty page in this block
+        stats[STAT_EMPTY_PAGES] -= 1
+        stats[STAT_DIRTY_PAGES] += 1
+        stats[STAT_ELAPSED_TIME] += write_page_time  # time spent to write the data
+        stats[STAT_PAGE_WRITE_EXECUTED] += 1  # one page written
+        return WRITE_SUCCESS
+
+    # if status is DIRTY => we discard this write operation
+    return WRITE_FAILED_DIRTY
+
+
+@njit(cache=True)
+def raw_read(status, stats, block, page, read_page_time):
+    """
+    Read a single page.
+
+    :param status: the page status matrix of the disk.
+    :param stats: the statistics vector of the disk.
+    :param block: the block index.
+    :param page: the page index.
+    :param read_page_time: the time to read a single page [microseconds].
+    :return: True if the page holds valid data, False otherwise (empty or dirty page).
+    """
+    if status[block, page] == PAGE_IN_USE:
+        stats[STAT_ELAPSED_TIME] += read_page_time  # time spent to read the data
+        stats[STAT_PAGE_READ_EXECUTED] += 1  # we executed a read of a page
+        return True
+
+    # no valid data to read
+    return False
+
+
+@njit(cache=True)
+def raw_erase(status, empty, dirty, next_free, stats, block, erase_block_time):
+    """
+    Erase a full block.
+
+    :param status: the page status matrix of the disk.
+    :param empty: the number of empty pages per block.
+    :param dirty: the number of dirty pages per block.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param stats: the statistics vector of the disk.
+    :param block: the block index.
+    :param erase_block_time: the time to erase a single block [microseconds].
+    """
+    status[block].fill(PAGE_EMPTY)
+    stats[STAT_EMPTY_PAGES] += status.shape[1] - empty[block]
+    stats[STAT_DIRTY_PAGES] -= dirty[block]
+    empty[block] = status.shape[1]  # all pages are empty
+    dirty[block] = 0  # fresh as new
+    next_free[block] = 0
+    stats[STAT_BLOCK_ERASE_EXECUTED] += 1  # new erase operation
+    stats[STAT_ELAPSED_TIME] += erase_block_time  # time spent to erase a block
+
+
+@njit(cache=True)
+def in_place_write(status, empty, dirty, next_free, stats, block, page, write_page_time, read_page_time,
+                   erase_block_time):
+    """
+    Rewrite a page of a full block in place: the valid pages are read, the block is erased and the valid pages
+    (the new data included) are written back in their original position.
+
+    :param status: the page status matrix of the disk.
+    :param empty: the number of empty pages per block.
+    :param dirty: the number of dirty pages per block.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param stats: the statistics vector of the disk.
+    :param block: the block index.
+    :param page: the page index.
+    :param write_page_time: the time to write a single page [microseconds].
+    :param read_page_time: the time to read a single page [microseconds].
+    :param erase_block_time: the time to erase a single block [microseconds].
+    """
+    row = status[block]
+
+    # the original page is not read: its data are replaced in memory
+    row[page] = PAGE_DIRTY
+
+    # read the valid pages and reset all the others
+    n_valid = 0
+    for p in range(row.shape[0]):
+        if row[p] == PAGE_IN_USE:
+            n_valid += 1
+        else:
+            row[p] = PAGE_EMPTY
+
+    # in-memory change
+    row[page] = PAGE_IN_USE
+    new_count = n_valid + 1
+
+    # update the statistics: read, erase and write
+    stats[STAT_EMPTY_PAGES] += row.shape[0] - new_count - empty[block]
+    stats[STAT_DIRTY_PAGES] -= dirty[block]
+    empty[block] = row.shape[0] - new_count
+    dirty[block] = 0
+    next_free[block] = 0
+    stats[STAT_ELAPSED_TIME] += n_valid * read_page_time + erase_block_time + new_count * write_page_time
+    stats[STAT_PAGE_READ_EXECUTED] += n_valid
+    stats[STAT_BLOCK_ERASE_EXECUTED] += 1
+    stats[STAT_PAGE_WRITE_EXECUTED] += new_count
+
+
+@njit(cache=True)
+def default_write(status, empty, dirty, next_free, stats, block, page, write_page_time):
+    """
+    Rewrite a page of a full block on the first empty page of a different block.
+
+    :param status: the page status matrix of the disk.
+    :param empty: the number of empty pages per block.
+    :param dirty: the number of dirty pages per block.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param stats: the statistics vector of the disk.
+    :param block: the block index.
+    :param page: the page index.
+    :param write_page_time: the time to write a single page [microseconds].
+    :return: True if the page was written, False if no other block has empty pages.
+    """
+    for b in range(empty.shape[0]):
+        if b != block and empty[b] > 0:
+            # FOUND a block with empty pages
+            p = first_empty_page(status, next_free, b)
+            status[block, page] = PAGE_DIRTY
+            status[b, p] = PAGE_IN_USE
+            dirty[block] += 1  # we have one more dirty page in this block
+            empty[b] -= 1  # we lost one empty page in this block
+            stats[STAT_DIRTY_PAGES] += 1
+            stats[STAT_EMPTY_PAGES] -= 1
+            stats[STAT_ELAPSED_TIME] += write_page_time  # time spent to write the data
+            stats[STAT_PAGE_WRITE_EXECUTED] += 1  # one page written
+            return True
+
+    # no empty page found
+    return False
+
+
+@njit(cache=True)
+def in_place_no_erase_write(status, empty, dirty, next_free, stats, block, page, write_page_time, read_page_time):
+    """
+    Rewrite a page of a full block on the first empty block: the valid pages are read and written in the new block
+    (the new data included, every page in its original position) and they are left dirty in the original block.
+    If no block is empty the page is written as default_write does.
+
+    :param status: the page status matrix of the disk.
+    :param empty: the number of empty pages per block.
+    :param dirty: the number of dirty pages per block.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param stats: the statistics vector of the disk.
+    :param block: the block index.
+    :param page: the page index.
+    :param write_page_time: the time to write a single page [microseconds].
+    :param read_page_time: the time to read a single page [microseconds].
+    :return: True if the page was written, False if no other block has empty pages.
+    """
+    # first we need to be sure there is a free block to execute the copy
+    newblock = -1
+    for b in range(empty.shape[0]):
+        if empty[b] == status.shape[1]:
+            newblock = b
+            break
+
+    if newblock < 0:
+        return default_write(status, empty, dirty, next_free, stats, block, page, write_page_time)
+
+    row = status[block]
+    new_row = status[newblock]
+
+    # the original page is not read: its data are replaced in memory
+    row[page] = PAGE_DIRTY
+
+    # read the valid pages, set them as dirty and write them in the new block
+    n_valid = 0
+    for p in range(row.shape[0]):
+        if row[p] == PAGE_IN_USE:
+            n_valid += 1
+            row[p] = PAGE_DIRTY
+            new_row[p] = PAGE_IN_USE
+
+    # in-memory change
+    new_row[page] = PAGE_IN_USE
+    new_count = n_valid + 1
+
+    # update the statistics: read and write
+    dirty[block] += n_valid  # new dirty pages
+    empty[newblock] -= new_count  # we lost these empty pages in the new block
+    stats[STAT_DIRTY_PAGES] += n_valid
+    stats[STAT_EMPTY_PAGES] -= new_count
+    stats[STAT_ELAPSED_TIME] += n_valid * read_page_time + new_count * write_page_time
+    stats[STAT_PAGE_READ_EXECUTED] += n_valid
+    stats[STAT_PAGE_WRITE_EXECUTED] += new_count
+    return True
+
+
+@njit(cache=True)
+def full_block_write(policy, status, empty, dirty, next_free, stats, block, page, write_page_time, read_page_time,
+                     erase_block_time):
+    """
+    Rewrite a page of a full block with the given write policy.
+
+    :param policy: one of the FULL_BLOCK_* write policies, except FULL_BLOCK_PYTHON.
+    :param status: the page status matrix of the disk.
+    :param empty: the number of empty pages per block.
+    :param dirty: the number of dirty pages per block.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param stats: the statistics vector of the disk.
+    :param block: the block index.
+    :param page: the page index.
+    :param write_page_time: the time to write a single page [microseconds].
+    :param read_page_time: the time to read a single page [microseconds].
+    :param erase_block_time: the time to erase a single block [microseconds].
+    :return: True if the page was written, False if the write failed (nothing is changed in this case).
+    """
+    if policy == FULL_BLOCK_IN_PLACE:
+        in_place_write(status, empty, dirty, next_free, stats, block, page, write_page_time, read_page_time,
+                       erase_block_time)
+        return True
+    if policy == FULL_BLOCK_IN_PLACE_NO_ERASE:
+        return in_place_no_erase_write(status, empty, dirty, next_free, stats, block, page, write_page_time,
+                                       read_page_time)
+    return default_write(status, empty, dirty, next_free, stats, block, page, write_page_time)
+
+
+@njit(cache=True)
+def host_write_batch(status, empty, dirty, next_free, stats, blocks, pages, start, gc_next_run, policy,
+                     write_page_time, read_page_time, erase_block_time):
+    """
+    Execute a batch of host page writes, in order, starting from the given index.
+    The batch stops on the first write that needs to leave the kernel: either the garbage collector may run,
+    or the block is full and the write policy is not available here, or the write fails and the garbage collector
+    could be forced to make room.
+
+    :param status: the page status matrix of the disk.
+    :param empty: the number of empty pages per block.
+    :param dirty: the number of dirty pages per block.
+    :param next_free: the index of the first page that may be empty, per block.
+    :param stats: the statistics vector of the disk.
+    :param blocks: the block indexes of the writes.
+    :param pages: the page indexes of the writes.
+    :param start: the index of the first write to execute.
+    :param gc_next_run: the simulation time from which the garbage collector may run, -1 if it never runs (not even
+                        when forced).
+    :param policy: the FULL_BLOCK_* write policy of the disk.
+    :param write_page_time: the time to write a single page [microseconds].
+    :param read_page_time: the time to read a single page [microseconds].
+    :param erase_block_time: the time to erase a single block [microseconds].
+    :return: the index of the write that must be executed outside the kernel, len(blocks) if the batch is done.
+    """
+    for i in range(start, blocks.shape[0]):
+        # the garbage collector may run: leave it to the disk
+        if 0 <= gc_next_run <= stats[STAT_ELAPSED_TIME]:
+            return i
+
+        block = blocks[i]
+        page = pages[i]
+        res = raw_write(status, empty, dirty, next_free, stats, block, page, write_page_time)
+        if res == WRITE_BLOCK_FULL:
+            # the block is full: a policy available in Python only is left to the disk
+            if policy == FULL_BLOCK_PYTHON:
+                return i
+
+            if full_block_write(policy, status, empty, dirty, next_free, stats, block, page, write_page_time,
+                                read_page_time, erase_block_time):
+                res = WRITE_SUCCESS
+            elif gc_next_run < 0:
+                # the write failed and forcing the garbage collector is useless, as it never runs (the disk would
+                # count the forced run and fail the same write again: see BaseNANDDisk.host_write_page)
+                stats[STAT_PAGE_WRITE_FAILED] += 1
+                stats[STAT_GC_FORCED_COUNT] += 1
+            else:
+                # the write failed: a forced run of the garbage collector is left to the disk
+                return i
+
+        if res == WRITE_SUCCESS:
+            stats[STAT_HOST_PAGE_WRITE_REQUEST] += 1  # the host actually asked to write a page
+
+    return blocks.shape[0]
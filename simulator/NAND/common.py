@@ -7,7 +7,8 @@ Common static values.
 """
 
 # IMPORTS
-from decimal import Decimal
+from decimal import Decimal, Context
+from functools import wraps
 
 # COMMON GLOBAL VALUES
 
@@ -17,14 +18,32 @@ DECIMAL_PRECISION = 12
 TWOPLACES = Decimal('0.01')
 NOPLACES = Decimal('0')
 
+# the context to compute the Decimal statistics, whatever the current context of the thread is
+DECIMAL_CONTEXT = Context(prec=DECIMAL_PRECISION)
+
 # THE PAGE STATUSES
-# The statuses of a page
-PAGE_IN_USE = "U"
-PAGE_DIRTY = "D"
-PAGE_EMPTY = "E"
+# The statuses of a page, stored as small integers in the FTL arrays (see BaseNANDDisk)
+PAGE_EMPTY = 0
+PAGE_IN_USE = 1
+PAGE_DIRTY = 2
 
 PAGE_STATUSES = (PAGE_IN_USE, PAGE_DIRTY, PAGE_EMPTY)
 
+# THE DISK STATISTICS
+# The indexes of the counters packed in the statistics vector of a disk (see BaseNANDDisk)
+STAT_ELAPSED_TIME = 0
+STAT_HOST_PAGE_WRITE_REQUEST = 1
+STAT_PAGE_WRITE_EXECUTED = 2
+STAT_PAGE_WRITE_FAILED = 3
+STAT_PAGE_READ_EXECUTED = 4
+STAT_BLOCK_ERASE_EXECUTED = 5
+STAT_HOST_PAGE_READ_REQUEST = 6
+STAT_GC_FORCED_COUNT = 7
+STAT_EMPTY_PAGES = 8
+STAT_DIRTY_PAGES = 9
+
+STATS_SIZE = 10
+
 
 # read\write results
 OPERATION_SUCCESS = 'SUCCESS'
@@ -38,9 +57,9 @@ def bytes_to_mib(pbytes=0):
     Convert a number of bytes into megabytes (MiB = 2^20).
 
     :param pbytes: the integer number of bytes to be converted.
-    :return: the Decimal result of the conversion.
+    :return: the float result of the conversion.
     """
-    return Decimal(pbytes) / Decimal(1048576)
+    return pbytes / 1048576
 
 
 def pages_to_mib(pages=0, page_size_bytes=4096):
@@ -49,7 +68,7 @@ def pages_to_mib(pages=0, page_size_bytes=4096):
 
     :param pages: the integer number of pages to be converted.
     :param page_size_bytes: the integer size of a single page in Bytes. Default value is 4096 Bytes (4 KiB).
-    :return: the Decimal result of the conversion.
+    :return: the float result of the conversion.
     """
     return bytes_to_mib(pages * page_size_bytes)
 
@@ -63,6 +82,17 @@ def get_quantized_decimal(dec=0):
     return Decimal(dec).quantize(TWOPLACES)
 
 
+def get_decimal_ratio(num=0, den=1):
+    """
+    Utility method to divide two exact numbers as Decimals, with DECIMAL_PRECISION digits (see DECIMAL_CONTEXT).
+    Unlike a float division, the result rounds exactly as the integer statistics dictate.
+    :param num: the numerator, an integer, a float or a Decimal (converted exactly).
+    :param den: the denominator, an integer, a float or a Decimal (converted exactly).
+    :return: the Decimal ratio.
+    """
+    return DECIMAL_CONTEXT.divide(Decimal(num), Decimal(den))
+
+
 def get_integer_decimal(dec=0):
     """
     Utility method to output Decimals with zero decimal places.
@@ -73,31 +103,44 @@ def get_integer_decimal(dec=0):
 
 
 # USEFUL DECORATORS
-def check_block(f):
+def _bound_check(name, position, limit_attr):
     """
-    A wrapper to validate the block parameter for a BaseNANDDisk class.
+    Build a decorator to validate an index parameter of a BaseNANDDisk method.
+    The parameter is accepted either by keyword or as the positional argument at the given position (self excluded).
+    When running with python -O the decorator returns the method unchanged.
+
+    :param name: the name of the parameter to validate.
+    :param position: the position of the parameter in the method signature, self excluded.
+    :param limit_attr: the name of the disk attribute holding the (excluded) upper bound of the parameter.
+    :return: the decorator.
     """
-    def wrapper(s, **kwargs):
-        if 'block' in kwargs:
-            block = kwargs['block']
-            if block < 0 or block >= s.total_blocks:
-                raise ValueError("block parameter out of range.")
+    message = "{} parameter out of range.".format(name)
 
-        # seems fine, let's proceed
-        return f(s, **kwargs)
-    return wrapper
+    def decorator(f):
+        if not __debug__:
+            return f
 
+        @wraps(f)
+        def wrapper(s, *args, **kwargs):
+            if position < len(args):
+                value = args[position]
+            elif name in kwargs:
+                value = kwargs[name]
+            else:
+                # default value
+                return f(s, *args, **kwargs)
 
-def check_page(f):
-    """
-    A wrapper to validate the page parameter for a BaseNANDDisk class.
-    """
-    def wrapper(s, **kwargs):
-        if 'page' in kwargs:
-            page = kwargs['page']
-            if page < 0 or page >= s.pages_per_block:
-                raise ValueError("page parameter out of range.")
-
-        # seems fine, let's proceed
-        return f(s, **kwargs)
-    return wrapper
+            if value < 0 or value >= getattr(s, limit_attr):
+                raise ValueError(message)
+
+            # seems fine, let's proceed
+            return f(s, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# validate the block parameter for a BaseNANDDisk class
+check_block = _bound_check('block', 0, '_TB')
+
+# validate the page parameter for a BaseNANDDisk class
+check_page = _bound_check('page', 1, '_PPB')
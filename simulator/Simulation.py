@@ -252,8 +252,8 @@ class Simulation(object):
 
             while try_again and attempts > 0:
                 # execute
-                res, status = self._disks[d].host_write_page(block=self._samples[d][0][self._samples_drift[d]],
-                                                             page=self._samples[d][1][self._samples_drift[d]])
+                res, status = self._disks[d].host_write_page(self._samples[d][0][self._samples_drift[d]],
+                                                             self._samples[d][1][self._samples_drift[d]])
 
                 # ok, increase the index
                 self._samples_drift[d] += 1
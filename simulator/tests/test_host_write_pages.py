@@ -0,0 +1,97 @@
+# This file is part of the WAF-Simulator by Nicholas Fiorentini (2015)
+# and is released under Creative Common Attribution 4.0 International (CC BY 4.0)
+# see README.txt or LICENSE.txt for details
+
+"""
+The batch of host writes (BaseNANDDisk.host_write_pages) must leave a disk exactly as a loop of host_write_page does,
+for every write policy and garbage collector. Run it with nosetests from the repository root.
+"""
+
+# IMPORTS
+import unittest
+import numpy as np
+from simulator.NAND.NANDFactory import get_class, get_instance, WRITEPOLICY_DEFAULT, WRITEPOLICY_INPLACE, \
+    WRITEPOLICY_INPLACE_NOERASE, GARBAGECOLLECTOR_NONE, GARBAGECOLLECTOR_SIMPLE
+from simulator.NAND._kernels import FULL_BLOCK_PYTHON, FULL_BLOCK_IN_PLACE
+
+# SETTINGS
+WRITE_POLICIES = (WRITEPOLICY_DEFAULT, WRITEPOLICY_INPLACE, WRITEPOLICY_INPLACE_NOERASE)
+GARBAGE_COLLECTORS = (GARBAGECOLLECTOR_NONE, GARBAGECOLLECTOR_SIMPLE)
+WORKLOADS = 20  # per write policy and garbage collector
+
+
+# TESTS
+class TestHostWritePages(unittest.TestCase):
+    """
+    Every workload runs on two identical disks: one with a single batch, the other with a loop of host_write_page.
+    """
+    def assertSameDisk(self, batch, loop):
+        np.testing.assert_array_equal(batch._stats, loop._stats)
+        np.testing.assert_array_equal(batch._status, loop._status)
+        np.testing.assert_array_equal(batch._empty, loop._empty)
+        np.testing.assert_array_equal(batch._dirty, loop._dirty)
+
+    def run_workload(self, batch, loop, blocks, pages):
+        written = batch.host_write_pages(blocks, pages)
+        expected = sum(1 for block, page in zip(blocks, pages) if loop.host_write_page(int(block), int(page))[0])
+        self.assertEqual(written, expected)
+        self.assertSameDisk(batch, loop)
+
+    def test_every_policy(self):
+        rng = np.random.RandomState(2015)
+        for wp in WRITE_POLICIES:
+            for gc in GARBAGE_COLLECTORS:
+                for _ in range(WORKLOADS):
+                    total_blocks = int(rng.randint(2, 9))
+                    pages_per_block = int(rng.randint(1, 9))
+                    gc_params = {'mintime': int(rng.randint(0, 2000)),
+                                 'dirtiness': rng.choice(['0.1', '0.25', '0.5', '1'])}
+                    disks = [get_instance(wp, gc, total_blocks, pages_per_block, gc_params=gc_params)
+                             for _ in range(2)]
+
+                    # small disks and long workloads: full blocks, failed and forced writes are common
+                    size = int(rng.randint(0, 20 * total_blocks * pages_per_block))
+                    blocks = rng.randint(0, total_blocks, size)
+                    pages = rng.randint(0, pages_per_block, size)
+                    with self.subTest(wp=wp, gc=gc, total_blocks=total_blocks, pages_per_block=pages_per_block):
+                        self.run_workload(disks[0], disks[1], blocks, pages)
+
+    def test_overridden_policy(self):
+        calls = []
+
+        class CountingInPlace(get_class(WRITEPOLICY_INPLACE, GARBAGECOLLECTOR_NONE)):
+            __slots__ = ()
+
+            def full_block_write_policy(self, block=0, page=0):
+                calls.append((block, page))
+                return super().full_block_write_policy(block, page)
+
+        self.assertEqual(get_instance(WRITEPOLICY_INPLACE).get_full_block_write_kernel(), FULL_BLOCK_IN_PLACE)
+        self.assertEqual(CountingInPlace(4, 4, 4096, 40, 20, 1500).get_full_block_write_kernel(), FULL_BLOCK_PYTHON)
+
+        # the overridden policy is called by the batch too
+        rng = np.random.RandomState(4)
+        blocks = rng.randint(0, 4, 200)
+        pages = rng.randint(0, 4, 200)
+        batch, loop = (CountingInPlace(4, 4, 4096, 40, 20, 1500) for _ in range(2))
+        self.run_workload(batch, loop, blocks, pages)
+        self.assertTrue(calls)
+        self.assertEqual(calls[:len(calls) // 2], calls[len(calls) // 2:])
+
+    def test_invalid_parameters(self):
+        disk = get_instance(total_blocks=4, pages_per_block=4)
+        with self.assertRaises(ValueError):
+            disk.host_write_pages(np.zeros((2, 2), dtype=int), np.zeros((2, 2), dtype=int))
+        with self.assertRaises(ValueError):
+            disk.host_write_pages([0, 1], [0])
+        with self.assertRaises(ValueError):
+            disk.host_write_pages([0, 4], [0, 0])
+        with self.assertRaises(ValueError):
+            disk.host_write_pages([0, 0], [0, -1])
+        with self.assertRaises(ValueError):
+            disk.host_write_pages([2 ** 33], [0])
+        with self.assertRaises(TypeError):
+            disk.host_write_pages([1.7], [0])
+
+        # nothing was written
+        self.assertSameDisk(disk, get_instance(total_blocks=4, pages_per_block=4))